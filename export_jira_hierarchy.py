@@ -4,7 +4,12 @@ Export epics, tasks and subtasks from a Jira project into a CSV file with the hi
 structure Epic → Task → Subtask.
 
 Usage:
-    python export_jira_hierarchy.py --project-key PROJ --output output.csv
+    python export_jira_hierarchy.py --project-key PROJ --output output.csv [--batch-size 500]
+
+Options:
+    --project-key, -k  Key of the Jira project to export
+    --output, -o       Path to the output CSV file (default: jira_hierarchy.csv)
+    --batch-size       Issues requested per search page (default: 500)
 
 Environment variables required:
     JIRA_URL         Base URL of your Jira instance, e.g. https://your-domain.atlassian.net
@@ -23,33 +28,169 @@ Each task appears on its own line; if the task has no subtasks the subtask colum
 """
 
 import os
-import csv
+import re
 import argparse
-from typing import List
-from jira import JIRA, Issue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 EPIC_ISSUE_TYPE = "Epic"
+SEARCH_PATH = "/rest/api/3/search/jql"
+# Max number of issue keys per ``in (...)`` clause, keeps the JQL well under URL limits.
+JQL_KEY_CHUNK = 50
+# Issues requested per search page; Jira may return fewer, pagination follows its token.
+DEFAULT_BATCH_SIZE = 500
+# CSV rows encoded per write, and the output file's buffer size.
+WRITE_BATCH_ROWS = 1000
+WRITE_BUFFER_BYTES = 1 << 20
+# Concurrent searches when a query is split into key chunks.
+MAX_WORKERS = 8
+
+# Characters that force a CSV field to be quoted (same rule as csv.QUOTE_MINIMAL).
+_NEEDS_QUOTE = re.compile(r'[",\r\n]')
+
+# Raw issue JSON as returned by the REST API: {"key": ..., "fields": {...}}
+Issue = Dict[str, Any]
+
+
+def jira_session(user: str, token: str) -> requests.Session:
+    """Return a keep-alive session reused for every request of the run.
+
+    Rate limits (429, honouring ``Retry-After``) and transient gateway errors are retried
+    with exponential backoff by the transport adapter.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=6,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry, pool_maxsize=MAX_WORKERS))
+    session.auth = (user, token)
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+        "User-Agent": "export_jira_hierarchy",
+    })
+    return session
 
 
-def fetch_all(jira: JIRA, jql: str, fields: List[str] | None = None) -> List[Issue]:
-    """Fetch *all* issues matching the JQL, transparently handling Jira pagination."""
+def fetch_all(
+    session: requests.Session,
+    jira_url: str,
+    jql: str,
+    fields: List[str] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[Issue]:
+    """Fetch *all* issues matching the JQL, following ``nextPageToken`` until the last page.
+
+    Only the listed *fields* are requested (never ``*all``/``*navigable``) and nothing is
+    expanded, keeping response payloads small.
+    """
     issues: List[Issue] = []
-    batch_size = 100
-    start_at = 0
+    params: Dict[str, Any] = {
+        "jql": jql,
+        "maxResults": batch_size,
+        "fields": ",".join(fields or ["summary"]),
+        "fieldsByKeys": "false",
+    }
     while True:
-        batch = jira.search_issues(jql_str=jql, startAt=start_at, maxResults=batch_size, fields=fields)
-        issues.extend(batch)
-        if len(batch) < batch_size:
+        resp = session.get(f"{jira_url.rstrip('/')}{SEARCH_PATH}", params=params)
+        resp.raise_for_status()
+        page = resp.json()
+        issues.extend(page.get("issues", []))
+        token = page.get("nextPageToken")
+        if page.get("isLast", True) or not token:
             break
-        start_at += batch_size
+        params["nextPageToken"] = token
     return issues
 
 
+def chunked(keys: List[str], size: int = JQL_KEY_CHUNK) -> Iterator[List[str]]:
+    """Yield successive *size*-long slices of *keys*."""
+    for i in range(0, len(keys), size):
+        yield keys[i : i + size]
+
+
+def fetch_chunked(
+    session: requests.Session,
+    jira_url: str,
+    jql_template: str,
+    keys: List[str],
+    fields: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[Issue]:
+    """Run *jql_template* (with ``{keys}``) once per key chunk, concurrently; results keep chunk order."""
+    def search(chunk: List[str]) -> List[Issue]:
+        jql = jql_template.format(keys=",".join(chunk))
+        return fetch_all(session, jira_url, jql, fields=fields, batch_size=batch_size)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return [issue for batch in executor.map(search, chunked(keys)) for issue in batch]
+
+
+def tasks_by_epic(
+    session: requests.Session, jira_url: str, epic_keys: List[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, List[Issue]]:
+    """Return {epic_key: [task, ...]} using one ``parent in (...)`` search per key chunk."""
+    grouped: Dict[str, List[Issue]] = defaultdict(list)
+    tasks = fetch_chunked(
+        session, jira_url, "parent in ({keys}) ORDER BY key", epic_keys,
+        fields=["summary", "subtasks", "parent"], batch_size=batch_size,
+    )
+    for task in tasks:
+        grouped[task["fields"]["parent"]["key"]].append(task)
+    return grouped
+
+
+def subtask_summaries(
+    session: requests.Session, jira_url: str, tasks: List[Issue], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, str]:
+    """Return {subtask_key: summary} for every sub-task of *tasks*.
+
+    Uses the summaries embedded in the task's ``subtasks`` field when present and resolves
+    the remaining keys with ``key in (...)`` searches.
+    """
+    summaries: Dict[str, str] = {}
+    missing: List[str] = []
+    for task in tasks:
+        for sub in task["fields"].get("subtasks") or []:
+            summary = sub.get("fields", {}).get("summary")
+            if summary is not None:
+                summaries[sub["key"]] = summary
+            else:
+                missing.append(sub["key"])
+    subs = fetch_chunked(session, jira_url, "key in ({keys})", missing, fields=["summary"], batch_size=batch_size)
+    summaries.update({sub["key"]: sub["fields"].get("summary") or "" for sub in subs})
+    return summaries
+
+
+def _quote(value: str) -> str:
+    if _NEEDS_QUOTE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def encode_rows(rows: List[List[str]]) -> bytes:
+    """Render *rows* as CSV (CRLF line endings, like ``csv.writer``) in one UTF-8 encode."""
+    return "".join(",".join(map(_quote, row)) + "\r\n" for row in rows).encode("utf-8")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Export epics, tasks and subtasks from a Jira project to CSV")
     parser.add_argument("--project-key", "-k", required=True, help="Key of the Jira project, e.g. PROJ")
     parser.add_argument("--output", "-o", default="jira_hierarchy.csv", help="Path to output CSV file")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Issues requested per search page (default: 500)"
+    )
     args = parser.parse_args()
 
     # --- Authenticate -------------------------------------------------------
@@ -60,63 +201,78 @@ def main():
     if not jira_url or not jira_user or not jira_token:
         raise EnvironmentError("JIRA_URL, JIRA_USER and JIRA_API_TOKEN environment variables must be set.")
 
-    jira = JIRA(server=jira_url, basic_auth=(jira_user, jira_token))
+    session = jira_session(jira_user, jira_token)
 
     # --- Collect epics ------------------------------------------------------
     epic_jql = f"project = {args.project_key} AND issuetype = \"{EPIC_ISSUE_TYPE}\" ORDER BY key"
-    epics = fetch_all(jira, epic_jql, fields=["summary"])
+    epics = fetch_all(session, jira_url, epic_jql, fields=["summary"], batch_size=args.batch_size)
 
     print(f"Found {len(epics)} epics in project {args.project_key}.")
 
+    # --- Collect tasks and sub-task summaries for all epics at once ---------
+    tasks_for_epic = tasks_by_epic(session, jira_url, [epic["key"] for epic in epics], batch_size=args.batch_size)
+    # Sub-task stubs embedded in the task response usually carry the summary already;
+    # only the ones that don't are looked up, in batched ``key in (...)`` queries.
+    sub_summary_by_key = subtask_summaries(
+        session, jira_url, [task for tasks in tasks_for_epic.values() for task in tasks], batch_size=args.batch_size
+    )
+
     # --- Prepare CSV writer -------------------------------------------------
-    with open(args.output, "w", newline="", encoding="utf-8") as csv_file:
-        writer = csv.writer(csv_file)
-        writer.writerow([
+    with open(args.output, "wb", buffering=WRITE_BUFFER_BYTES) as csv_file:
+        csv_file.write(encode_rows([[
             "epic_key",
             "epic_summary",
             "task_key",
             "task_summary",
             "subtask_key",
             "subtask_summary",
-        ])
+        ]]))
+
+        # Rows are buffered, then encoded and written in batches.
+        rows_buf: List[List[str]] = []
 
         # --- Loop epics -----------------------------------------------------
         for epic in epics:
-            epic_key = epic.key
-            epic_summary = epic.fields.summary
+            if len(rows_buf) >= WRITE_BATCH_ROWS:
+                csv_file.write(encode_rows(rows_buf))
+                rows_buf.clear()
+
+            epic_key = epic["key"]
+            epic_summary = epic["fields"].get("summary") or ""
 
-            # Fetch tasks linked to the epic (Story, Task, Bug, etc.).
-            task_jql = f'parent = {epic_key} ORDER BY key'
-            tasks = fetch_all(jira, task_jql, fields=["summary", "subtasks"])
+            # Tasks linked to the epic (Story, Task, Bug, etc.).
+            tasks = tasks_for_epic.get(epic_key, [])
 
-            print(f"Found {len(tasks)} tasks in project {epic_key}. by {task_jql}")
+            print(f"Found {len(tasks)} tasks in epic {epic_key}.")
 
             if not tasks:
                 # Epic without child tasks ⇒ write a single row with blanks for task/subtask
-                writer.writerow([epic_key, epic_summary, "", "", "", ""])
+                rows_buf.append([epic_key, epic_summary, "", "", "", ""])
                 continue
 
             for task in tasks:
-                task_key = task.key
-                task_summary = task.fields.summary or ""
+                task_key = task["key"]
+                task_summary = task["fields"].get("summary") or ""
+                subtasks = task["fields"].get("subtasks") or []
 
-                if not task.fields.subtasks:
+                if not subtasks:
                     # Task without subtasks ⇒ single row, blank subtask columns
-                    writer.writerow([epic_key, epic_summary, task_key, task_summary, "", ""])
+                    rows_buf.append([epic_key, epic_summary, task_key, task_summary, "", ""])
                     continue
 
                 # Task with subtasks ⇒ multiple rows, one per subtask
-                for sub in task.fields.subtasks:
-                    sub_issue = jira.issue(sub.key, fields=["summary"])
-                    writer.writerow([
+                for sub in subtasks:
+                    rows_buf.append([
                         epic_key,
                         epic_summary,
                         task_key,
                         task_summary,
-                        sub_issue.key,
-                        sub_issue.fields.summary or "",
+                        sub["key"],
+                        sub_summary_by_key.get(sub["key"]) or "",
                     ])
 
+        csv_file.write(encode_rows(rows_buf))
+
     print(f"Export completed: {args.output}")
 
 
@@ -24,6 +24,11 @@ An issue is considered existing when another issue **in the destination project*
 same **issue type** **and** an identical **Summary** (case‑insensitive). Swap this for a
 label or external‑ID match if you prefer.
 
+With ``--checkpoint`` every created issue, and every Epic / Task matched to an existing
+issue, is also appended to a JSON‑lines file; a re‑run after a crash restores those keys
+first and skips the project‑wide index entirely when the checkpoint already covers every
+Epic and Task in the CSV.
+
 Usage
 ~~~~~
 ::
@@ -39,6 +44,8 @@ Optional flags::
 
     --epic-name-field  customfield_12345   # if your Epic Name field ≠ default
     --batch-size       50                  # number of Tasks per add_issues_to_epic() batch
+    --workers          10                  # concurrent bulk create / link calls
+    --checkpoint       import.jsonl        # record created/matched issues, resume from them on re-run
 
 Environment vars (same as exporter)::
 
@@ -54,12 +61,22 @@ from __future__ import annotations
 
 import argparse
 import csv
+import json
 import os
 import sys
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterator, List, Sequence, Set, TextIO, Tuple, TypeVar
 
 from jira import JIRA, Issue  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+K = TypeVar("K")
+
+# Issues per create_issues() call; Jira's bulk endpoint accepts up to 50.
+BULK_CREATE_CHUNK = 50
 
 # ---------------------------------------------------------------------
 # CLI
@@ -81,6 +98,13 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument(
         "--batch-size", type=int, default=50, help="Batch size for add_issues_to_epic()",
     )
+    ap.add_argument(
+        "--workers", type=int, default=10, help="Concurrent create_issues() / add_issues_to_epic() calls",
+    )
+    ap.add_argument(
+        "--checkpoint",
+        help="JSON‑lines file recording created and matched issues; re‑runs resume from it",
+    )
     return ap.parse_args()
 
 
@@ -89,20 +113,37 @@ def parse_args() -> argparse.Namespace:
 # ---------------------------------------------------------------------
 
 
-def jira_client() -> JIRA:
+def jira_client(workers: int = 10) -> JIRA:
     url = os.getenv("JIRA_URL")
     user = os.getenv("JIRA_USER")
     token = os.getenv("JIRA_API_TOKEN")
     if not (url and user and token):
         sys.exit("JIRA_URL, JIRA_USER, JIRA_API_TOKEN env vars must be set!")
-    return JIRA(server=url, basic_auth=(user, token))
+    # max_retries=0 turns off the client's own sleep‑and‑retry loop; the adapter below is
+    # the only retry layer.
+    jira = JIRA(server=url, basic_auth=(user, token), max_retries=0)
+    # Back off on rate limits per request inside the adapter, so one throttled call doesn't
+    # stall the whole thread pool. Only responses that guarantee nothing was applied are
+    # retried: no 502/504 and no read errors (read=0), since a POST may already have landed.
+    retry = Retry(
+        total=6,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[429, 503],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # The client exposes no hook for transport adapters, so mount on its (private) session.
+    jira._session.mount("https://", HTTPAdapter(max_retries=retry, pool_maxsize=workers))
+    return jira
 
 
 def existing_issues_index(jira: JIRA, project_key: str) -> Dict[Tuple[str, str], Issue]:
     """Return {(issuetype, lower(summary)): jira.Issue} for all issues in project."""
     idx: Dict[Tuple[str, str], Issue] = {}
     start_at = 0
-    max_results = 100
+    max_results = 500
     jql = f"project = {project_key}"
     while True:
         chunk = jira.search_issues(
@@ -117,12 +158,60 @@ def existing_issues_index(jira: JIRA, project_key: str) -> Dict[Tuple[str, str],
         for issue in chunk:
             key = (issue.fields.issuetype.name.lower(), issue.fields.summary.lower())
             idx.setdefault(key, issue)
+        if start_at == 0 and len(chunk) < max_results:
+            max_results = len(chunk)  # server capped maxResults, page by what it returns
         start_at += max_results
     return idx
 
 
-def issue_exists(idx: Dict[Tuple[str, str], Issue], issue_type: str, summary: str) -> Issue | None:
-    return idx.get((issue_type.lower(), summary.lower()))
+def children_by_parent(
+    jira: JIRA, parent_keys: List[str], fields: List[str] | None = None, chunk_size: int = 50
+) -> Dict[str, List[Issue]]:
+    """Return {parent_key: [child issue, …]} via chunked ``parent in (…)`` searches.
+
+    Only *fields* (plus ``parent``, needed for grouping) are requested.
+    """
+    fields = sorted({"parent", *(fields or [])})
+    by_parent: Dict[str, List[Issue]] = defaultdict(list)
+    for i in range(0, len(parent_keys), chunk_size):
+        chunk = parent_keys[i : i + chunk_size]
+        children = jira.search_issues(
+            f"parent in ({','.join(chunk)})",
+            maxResults=False,
+            fields=fields,
+            expand=None,
+        )
+        for child in children:
+            by_parent[child.fields.parent.key].append(child)
+    return by_parent
+
+
+def subtask_summaries_by_parent(jira: JIRA, parent_keys: List[str]) -> Dict[str, Set[str]]:
+    """Return {parent_key: {lower(subtask summary), …}} for the given Tasks."""
+    by_parent: Dict[str, Set[str]] = defaultdict(set)
+    for parent_key, subs in children_by_parent(jira, parent_keys, fields=["summary"]).items():
+        by_parent[parent_key].update(sub.fields.summary.lower() for sub in subs)
+    return by_parent
+
+
+def link_tasks(jira: JIRA, epic_key: str, task_keys: List[str]) -> None:
+    try:
+        jira.add_issues_to_epic(epic_key, task_keys)
+        print(f"Linked {len(task_keys)} tasks → {epic_key}", file=sys.stderr)
+    except Exception as e:  # noqa: BLE001
+        print(f"Failed to link tasks to {epic_key}: {e}", file=sys.stderr)
+
+
+def bulk_results(tags: List[K], results: List[dict]) -> Iterator[Tuple[K, Issue]]:
+    """Pair a ``create_issues()`` result list with its tags; yield successes, report failures."""
+    for tag, result in zip(tags, results):
+        if result["status"] == "Success":
+            yield tag, result["issue"]
+        else:
+            print(
+                f"⚠️  Failed to create '{result['input_fields'].get('summary')}': {result['error']}",
+                file=sys.stderr,
+            )
 
 
 # ---------------------------------------------------------------------
@@ -130,9 +219,15 @@ def issue_exists(idx: Dict[Tuple[str, str], Issue], issue_type: str, summary: st
 # ---------------------------------------------------------------------
 
 
-def load_rows(csv_path: str) -> List[dict]:
+def iter_rows(csv_path: str, *columns: str) -> Iterator[Tuple[str, ...]]:
+    """Stream the given *columns* of each CSV row as a tuple, in the order requested.
+
+    Uses ``csv.reader`` with header positions resolved once, and re‑opens the file for
+    every pass instead of holding it in memory.
+    """
     with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
         required = [
             "epic_key",
             "epic_summary",
@@ -141,10 +236,94 @@ def load_rows(csv_path: str) -> List[dict]:
             "subtask_key",
             "subtask_summary",
         ]
-        missing = [h for h in required if h not in (reader.fieldnames or [])]
+        missing = [h for h in required if h not in header]
         if missing:
             raise ValueError(f"CSV missing headers: {', '.join(missing)}")
-        return list(reader)
+        positions = [header.index(c) for c in columns]
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue  # blank line
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            yield tuple([row[i] for i in positions])
+
+
+def discover_hierarchy(csv_path: str) -> Tuple[List[str], Dict[str, str]]:
+    """Single streaming pass returning (unique epic summaries, {task summary: epic summary}).
+
+    Both preserve first‑seen CSV order; a Task keeps the Epic of its first row.
+    """
+    epic_summaries: Dict[str, None] = {}
+    task_epic: Dict[str, str] = {}
+    for epic_summary, task_summary in iter_rows(csv_path, "epic_summary", "task_summary"):
+        epic_summary = epic_summary.strip()
+        task_summary = task_summary.strip()
+        if epic_summary:
+            epic_summaries.setdefault(epic_summary)
+        if task_summary:
+            task_epic.setdefault(task_summary, epic_summary)
+    return list(epic_summaries), task_epic
+
+
+def iter_subtasks(csv_path: str) -> Iterator[Tuple[str, str]]:
+    """Stream ``(task summary, sub‑task summary)`` for every row that has a Sub‑task."""
+    for task_summary, sub_summary in iter_rows(csv_path, "task_summary", "subtask_summary"):
+        task_summary = task_summary.strip()
+        sub_summary = sub_summary.strip()
+        if not sub_summary:
+            continue
+        if not task_summary:
+            print(f"⚠️  CSV error: no task for sub‑task '{sub_summary}'", file=sys.stderr)
+            continue
+        yield task_summary, sub_summary
+
+
+# ---------------------------------------------------------------------
+# Checkpoint
+# ---------------------------------------------------------------------
+
+
+def load_checkpoint(path: str) -> List[dict]:
+    """Return the entries of a JSON‑lines checkpoint; a missing file means a fresh start.
+
+    A line cut short by a crash mid‑write is skipped with a warning.
+    """
+    if not os.path.exists(path):
+        return []
+    entries: List[dict] = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"⚠️  Skipping malformed checkpoint line {lineno} in {path}", file=sys.stderr)
+    return entries
+
+
+def open_checkpoint(path: str) -> TextIO:
+    """Open the checkpoint for appending, starting on a fresh line if the last write was cut short."""
+    f = open(path, "a+", encoding="utf-8")
+    if f.tell() > 0:
+        f.seek(f.tell() - 1)
+        if f.read(1) != "\n":
+            f.write("\n")
+    return f
+
+
+def record_checkpoint(
+    checkpoint: TextIO | None, kind: str, summary: str, key: str, parent: str | None = None
+) -> None:
+    """Append one created issue to the checkpoint and flush, so a crash loses nothing."""
+    if checkpoint is None:
+        return
+    entry = {"kind": kind, "summary": summary, "key": key}
+    if parent is not None:
+        entry["parent"] = parent
+    checkpoint.write(json.dumps(entry) + "\n")
+    checkpoint.flush()
 
 
 # ---------------------------------------------------------------------
@@ -154,126 +333,240 @@ def load_rows(csv_path: str) -> List[dict]:
 
 def main() -> None:
     args = parse_args()
-    rows = load_rows(args.csv)
-    jira = jira_client()
-
-    print("Indexing existing issues …", file=sys.stderr)
-    idx = existing_issues_index(jira, args.project_key)
-    print(f"Indexed {len(idx)} existing issues", file=sys.stderr)
-
-    epic_map: Dict[str, Issue] = {}
-    task_map: Dict[str, Issue] = {}
+    epic_summaries, task_epic = discover_hierarchy(args.csv)
+    jira = jira_client(args.workers)
+
+    # summary → issue key of Epics / Tasks that exist (or were created by an earlier run)
+    epic_map: Dict[str, str] = {}
+    task_map: Dict[str, str] = {}
+    restored_subs: Dict[str, Set[str]] = defaultdict(set)
+
+    if args.checkpoint:
+        for entry in load_checkpoint(args.checkpoint):
+            if entry["kind"] == "epic":
+                epic_map[entry["summary"]] = entry["key"]
+            elif entry["kind"] == "task":
+                task_map[entry["summary"]] = entry["key"]
+            else:
+                restored_subs[entry["parent"]].add(entry["summary"].lower())
+        print(f"Restored {len(epic_map)} epics, {len(task_map)} tasks from checkpoint", file=sys.stderr)
 
-    # 1️⃣ Create Epics that don't exist --------------------------------
-    for r in rows:
-        summary = r["epic_summary"].strip()
-        if not summary:
-            continue  # defensive
+    idx: Dict[Tuple[str, str], Issue] = {}
+    if all(s in epic_map for s in epic_summaries) and all(s in task_map for s in task_epic):
+        print("Checkpoint covers every Epic and Task; skipping project index", file=sys.stderr)
+    else:
+        print("Indexing existing issues …", file=sys.stderr)
+        idx = existing_issues_index(jira, args.project_key)
+        print(f"Indexed {len(idx)} existing issues", file=sys.stderr)
+
+    # 1️⃣ Resolve Epics and Tasks that already exist -------------------
+    # Matches from the project index go into the checkpoint too (once it is open), so a
+    # resume covers them without scanning the project again.
+    resolved_from_index: List[Tuple[str, str, str]] = []
+    epics_to_create: List[str] = []
+    for summary in epic_summaries:
         if summary in epic_map:
-            continue  # already processed in this run
-        existing = issue_exists(idx, "Epic", summary)
+            continue  # restored from checkpoint
+        existing = idx.get(("epic", summary.lower()))
         if existing:
-            epic_map[summary] = existing
-            continue
-        if args.dry_run:
-            print(f"DRY‑RUN: would create Epic '{summary}' in {args.project_key}", file=sys.stderr)
-            epic_map[summary] = object()  # type: ignore[assignment]
-            continue
-        issue = jira.create_issue(fields={
-            "project": {"key": args.project_key},
-            "summary": summary,
-            "issuetype": {"name": "Epic"},
-            # epic_name_field: summary,
-        })
-        print(f"Created EPIC {issue.key}: {summary}", file=sys.stderr)
-        epic_map[summary] = issue
-        idx[("epic", summary.lower())] = issue  # extend index
-
-    # 2️⃣ Create Tasks + Sub‑tasks ------------------------------------
-    epic_to_task_summaries: Dict[str, List[str]] = defaultdict(list)
+            epic_map[summary] = existing.key
+            resolved_from_index.append(("epic", summary, existing.key))
+        else:
+            epics_to_create.append(summary)
 
-    for r in rows:
-        epic_summary = r["epic_summary"].strip()
-        task_summary = r["task_summary"].strip()
-        sub_summary = r["subtask_summary"].strip()
+    epic_to_task_summaries: Dict[str, List[str]] = defaultdict(list)
+    tasks_to_create: List[str] = []
+    for task_summary, epic_summary in task_epic.items():
+        task_summary_lc = task_summary.lower()
+        if task_summary in task_map:
+            pass  # restored from checkpoint
+        elif existing_task := idx.get(("task", task_summary_lc)) or idx.get(("story", task_summary_lc)):
+            task_map[task_summary] = existing_task.key
+            resolved_from_index.append(("task", task_summary, existing_task.key))
+        else:
+            tasks_to_create.append(task_summary)
+        # record for linking later
+        epic_to_task_summaries[epic_summary].append(task_summary)
+
+    # Only pre‑existing Tasks can already have Sub‑tasks; fetch them all up front.
+    subtasks_by_parent = subtask_summaries_by_parent(jira, sorted(set(task_map.values())))
+    for parent_key, summaries_lc in restored_subs.items():
+        subtasks_by_parent[parent_key].update(summaries_lc)
+
+    def is_new_subtask(parent_key: str, sub_summary: str) -> bool:
+        """True the first time a Sub‑task is seen under *parent_key* (in Jira or this run)."""
+        sub_summary_lc = sub_summary.lower()
+        existing_subs_lc = subtasks_by_parent[parent_key]
+        if sub_summary_lc in existing_subs_lc:
+            return False
+        existing_subs_lc.add(sub_summary_lc)
+        return True
 
-        # TASK --------------------------------------------------------
-        if task_summary and task_summary not in task_map:
-            existing_task = issue_exists(idx, "Task", task_summary) or issue_exists(idx, "Story", task_summary)
-            if existing_task:
-                task_map[task_summary] = existing_task
-            else:
-                if args.dry_run:
-                    print(f"DRY‑RUN: would create Task '{task_summary}'", file=sys.stderr)
-                    task_map[task_summary] = object()  # type: ignore[assignment]
-                else:
-                    issue = jira.create_issue(
-                        project={"key": args.project_key},
-                        issuetype={"name": "Task"},
-                        summary=task_summary,
-                    )
-                    print(f"Created TASK {issue.key}: {task_summary}", file=sys.stderr)
-                    task_map[task_summary] = issue
-                    idx[(issue.fields.issuetype.name.lower(), task_summary.lower())] = issue
-            # record for linking later
-            epic_to_task_summaries[epic_summary].append(task_summary)
-
-        # SUB‑TASK ----------------------------------------------------
-        if sub_summary:
-            parent_issue = task_map.get(task_summary)
-            if parent_issue is None:
-                print(
-                    f"⚠️  CSV order error: task '{task_summary}' missing before sub‑task",
-                    file=sys.stderr,
-                )
-                continue
-            # Check if sub‑task exists under parent
-            existing_sub = None
-            if isinstance(parent_issue, Issue):
-                parent_details = jira.issue(parent_issue.key, fields=["subtasks"])
-                for sub in parent_details.fields.subtasks:
-                    if sub.fields.summary.lower() == sub_summary.lower():
-                        existing_sub = sub
-                        break
-            if existing_sub:
-                continue  # already there
-            if args.dry_run:
+    if args.dry_run:
+        for summary in epics_to_create:
+            print(f"DRY‑RUN: would create Epic '{summary}' in {args.project_key}", file=sys.stderr)
+        for task_summary in tasks_to_create:
+            print(f"DRY‑RUN: would create Task '{task_summary}'", file=sys.stderr)
+        for task_summary, sub_summary in iter_subtasks(args.csv):
+            if is_new_subtask(task_map.get(task_summary, task_summary), sub_summary):
                 print(
                     f"DRY‑RUN: would create Sub‑task '{sub_summary}' under '{task_summary}'",
                     file=sys.stderr,
                 )
-            else:
-                jira.create_issue(
-                    project={"key": args.project_key},
-                    issuetype={"name": "Sub-task"},
-                    summary=sub_summary,
-                    parent={"key": parent_issue.key} if isinstance(parent_issue, Issue) else None,
-                )
-                print(
-                    f"Created SUB‑TASK under {parent_issue.key if isinstance(parent_issue, Issue) else task_summary}: {sub_summary}",
-                    file=sys.stderr,
-                )
-
-    # 3️⃣ Link Tasks to Epics -----------------------------------------
-    if args.dry_run:
         print("DRY‑RUN: would now link tasks to epics", file=sys.stderr)
         return
 
-    for epic_summary, task_summaries in epic_to_task_summaries.items():
-        epic_issue = epic_map.get(epic_summary)
-        if not isinstance(epic_issue, Issue):
-            continue  # placeholder in dry‑run or error
-
-        task_keys = [task_map[s].key for s in task_summaries if isinstance(task_map.get(s), Issue)]
-        for i in range(0, len(task_keys), args.batch_size):
-            batch = task_keys[i : i + args.batch_size]
-            if not batch:
-                continue
+    # Tasks already under their Epic (re‑runs, partial failures) don't need another call.
+    already_linked: Dict[str, Set[str]] = {
+        epic_key: {child.key for child in children}
+        for epic_key, children in children_by_parent(jira, sorted(set(epic_map.values()))).items()
+    }
+
+    # 2️⃣ Create and link as dependencies resolve ---------------------
+    # Epics and Tasks are independent, so both start immediately, and an Epic is linked
+    # once it and all of its Tasks are resolved. Sub‑tasks are streamed from the CSV in
+    # bulk chunks, with at most 2 × workers chunks in flight so memory stays bounded
+    # however large the file is: first those under already‑known Tasks, alongside Task
+    # creation, then (in a second read) those under Tasks created in this run.
+    tasks_pending_by_epic: Dict[str, int] = defaultdict(int)
+    for task_summary in tasks_to_create:
+        tasks_pending_by_epic[task_epic[task_summary]] += 1
+    epics_pending: Set[str] = set(epics_to_create)
+    epics_linked: Set[str] = set()
+    max_in_flight = 2 * args.workers
+    known_parents: Set[str] = set(task_map)  # Tasks with a key before anything is created
+
+    with (
+        open_checkpoint(args.checkpoint) if args.checkpoint else nullcontext()
+    ) as checkpoint, ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for kind, summary, key in resolved_from_index:
+            record_checkpoint(checkpoint, kind, summary, key)
+        pending: Dict[Future, Tuple[str, list]] = {}
+
+        def submit_create(kind: str, items: Sequence[Tuple[object, dict]]) -> None:
+            for i in range(0, len(items), BULK_CREATE_CHUNK):
+                chunk = items[i : i + BULK_CREATE_CHUNK]
+                future = executor.submit(
+                    jira.create_issues, field_list=[fields for _, fields in chunk], prefetch=False
+                )
+                pending[future] = (kind, [tag for tag, _ in chunk])
+
+        def maybe_link(epic_summary: str) -> None:
+            epic_key = epic_map.get(epic_summary)
+            if (
+                epic_key is None  # not created (yet, or failed)
+                or epic_summary in epics_pending
+                or tasks_pending_by_epic[epic_summary]
+                or epic_summary in epics_linked
+            ):
+                return
+            epics_linked.add(epic_summary)
+            linked = already_linked.get(epic_key, set())
+            task_keys = [
+                task_map[s] for s in epic_to_task_summaries[epic_summary]
+                if s in task_map and task_map[s] not in linked
+            ]
+            for i in range(0, len(task_keys), args.batch_size):
+                future = executor.submit(link_tasks, jira, epic_key, task_keys[i : i + args.batch_size])
+                pending[future] = ("link", [])
+
+        def handle(future: Future) -> None:
+            kind, tags = pending.pop(future)
+            if kind == "link":
+                future.result()  # link_tasks() reports its own errors
+                return
             try:
-                jira.add_issues_to_epic(epic_issue.key, batch)
-                print(f"Linked {len(batch)} tasks → {epic_issue.key}", file=sys.stderr)
+                results = future.result()
             except Exception as e:  # noqa: BLE001
-                print(f"Failed to link tasks to {epic_issue.key}: {e}", file=sys.stderr)
+                # The whole chunk failed; report it and treat every issue in it as not created.
+                print(f"⚠️  Failed to create {len(tags)} {kind}(s): {e}", file=sys.stderr)
+                results = []
+            for tag, issue in bulk_results(tags, results):
+                if kind == "epic":
+                    print(f"Created EPIC {issue.key}: {tag}", file=sys.stderr)
+                    epic_map[tag] = issue.key
+                    record_checkpoint(checkpoint, "epic", tag, issue.key)
+                elif kind == "task":
+                    print(f"Created TASK {issue.key}: {tag}", file=sys.stderr)
+                    task_map[tag] = issue.key
+                    record_checkpoint(checkpoint, "task", tag, issue.key)
+                else:
+                    parent_key, sub_summary = tag
+                    print(f"Created SUB‑TASK under {parent_key}: {sub_summary}", file=sys.stderr)
+                    record_checkpoint(checkpoint, "subtask", sub_summary, issue.key, parent=parent_key)
+            if kind == "epic":
+                for summary in tags:
+                    epics_pending.discard(summary)
+                    maybe_link(summary)
+            elif kind == "task":
+                for task_summary in tags:
+                    tasks_pending_by_epic[task_epic[task_summary]] -= 1
+                    maybe_link(task_epic[task_summary])
+
+        def handle_next() -> None:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                handle(future)
+
+        def stream_subtasks(selected: Callable[[str], bool]) -> None:
+            """Stream the CSV and submit new Sub‑tasks of the *selected* Tasks in bulk chunks."""
+            sub_items: List[Tuple[Tuple[str, str], dict]] = []
+            for task_summary, sub_summary in iter_subtasks(args.csv):
+                if not selected(task_summary):
+                    continue
+                sub_parent_key = task_map.get(task_summary)
+                if sub_parent_key is None:
+                    continue  # Task creation failed, already reported
+                if not is_new_subtask(sub_parent_key, sub_summary):
+                    continue  # already there
+                sub_items.append(((sub_parent_key, sub_summary), {
+                    "project": {"key": args.project_key},
+                    "issuetype": {"name": "Sub-task"},
+                    "summary": sub_summary,
+                    "parent": {"key": sub_parent_key},
+                }))
+                if len(sub_items) == BULK_CREATE_CHUNK:
+                    submit_create("subtask", sub_items)
+                    sub_items = []
+                    while len(pending) >= max_in_flight:
+                        handle_next()
+            submit_create("subtask", sub_items)
+
+        try:
+            submit_create("epic", [
+                (summary, {
+                    "project": {"key": args.project_key},
+                    "summary": summary,
+                    "issuetype": {"name": "Epic"},
+                    # epic_name_field: summary,
+                })
+                for summary in epics_to_create
+            ])
+            submit_create("task", [
+                (task_summary, {
+                    "project": {"key": args.project_key},
+                    "issuetype": {"name": "Task"},
+                    "summary": task_summary,
+                })
+                for task_summary in tasks_to_create
+            ])
+            for epic_summary in epic_to_task_summaries:
+                maybe_link(epic_summary)
+
+            # Sub‑tasks of Tasks that already have a key go out right away …
+            stream_subtasks(lambda task_summary: task_summary in known_parents)
+
+            # … the rest need their new parent's key, so wait until every Task chunk is back.
+            while any(kind == "task" for kind, _ in pending.values()):
+                handle_next()
+            stream_subtasks(lambda task_summary: task_summary not in known_parents)
+
+            while pending:
+                handle_next()
+        except BaseException:
+            # Don't let queued chunks keep creating issues that nobody records.
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
 
 
 if __name__ == "__main__":